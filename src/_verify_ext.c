@@ -0,0 +1,63 @@
+/*
+ * Native kernel for verify.py's bulk ASCII path (loaded with ctypes when built).
+ * verify.py falls back to pure Python when the shared library is missing.
+ *
+ * Build (from the repo root):
+ *   gcc -O3 -march=native -shared -fPIC -o src/_verify_ext.so src/_verify_ext.c
+ */
+#include <stddef.h>
+#include <stdint.h>
+#include <string.h>
+
+#define HIGH_BITS 0x8080808080808080ULL
+
+/* SWAR ASCII check: OR 8 bytes at a time, then test every byte's high bit at once. */
+static int is_ascii(const unsigned char* p, size_t n)
+{
+    uint64_t acc = 0;
+    size_t i = 0;
+    for (; i + 8 <= n; i += 8) {
+        uint64_t w;
+        memcpy(&w, p + i, 8);
+        acc |= w;
+    }
+    for (; i < n; ++i) acc |= p[i];
+    return (acc & HIGH_BITS) == 0;
+}
+
+/*
+ * Length of the longest run of whole lines at the start of in[0, len) that are ASCII and whose
+ * reversal (content reversed, "\n" / "\r\n" kept in place) equals out at the same offsets.
+ * A last line without '\n' counts when it runs to len. Both buffers must hold len bytes.
+ * Returns len when the whole block verifies; otherwise the offset of the first line that doesn't.
+ */
+size_t verify_ascii_reversed(const char* in_, const char* out_, size_t len)
+{
+    const unsigned char* in = (const unsigned char*)in_;
+    const unsigned char* out = (const unsigned char*)out_;
+    size_t pos = 0;
+
+    while (pos < len) {
+        const unsigned char* nl = memchr(in + pos, '\n', len - pos);
+        size_t end = nl ? (size_t)(nl - in) + 1 : len;
+        size_t content_end = end;
+        if (nl) {
+            content_end = end - 1;
+            if (content_end > pos && in[content_end - 1] == '\r') --content_end;
+        }
+
+        if (!is_ascii(in + pos, end - pos)) return pos;
+
+        /* compare against the output read backwards: no reversed copy is built */
+        const unsigned char* src = in + pos;
+        const unsigned char* dst = out + pos;
+        size_t n = content_end - pos;
+        for (size_t i = 0; i < n; ++i) {
+            if (src[i] != dst[n - 1 - i]) return pos;
+        }
+        if (memcmp(in + content_end, out + content_end, end - content_end) != 0) return pos;
+
+        pos = end;
+    }
+    return pos;
+}
@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import multiprocessing
 import os
 import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # -----------------------------
@@ -20,30 +23,91 @@ OUT_DIR.mkdir(parents=True, exist_ok=True)
 
 MiB = 1024 * 1024
 
+# Write buffer for every output file. Larger buffers mean fewer write() syscalls on the big files.
+# Example:
+#   WRITE_BUF=16777216 python3 generate_tests.py
+WRITE_BUF = int(os.environ.get("WRITE_BUF", str(8 * MiB)))
+
+# Number of worker processes generating files in parallel.
+# Example:
+#   GEN_JOBS=1 python3 generate_tests.py
+GEN_JOBS = int(os.environ.get("GEN_JOBS", str(min(8, os.cpu_count() or 1))))
+
+# Comma-separated generator allow/block lists; "gen_23" matches gen_23_boundary_newline_at_buf_minus_1.
+# Example:
+#   GEN_SKIP=gen_33,gen_34 python3 generate_tests.py
+#   GEN_ONLY=gen_23,gen_26 python3 generate_tests.py
+GEN_ONLY = [s.strip() for s in os.environ.get("GEN_ONLY", "").split(",") if s.strip()]
+GEN_SKIP = [s.strip() for s in os.environ.get("GEN_SKIP", "").split(",") if s.strip()]
+
 
 # -----------------------------
 # Helpers
 # -----------------------------
+ManifestRow = tuple[str, str, int, str]  # (name, newline, bytes, description)
+
+_FILL_TILE_BYTES = 64 * 1024
+_ALPHABET_CACHE: dict[bytes, bytes] = {}
+
+
 def fill_bytes(n: int, alphabet: bytes = b"abcdefghijklmnopqrstuvwxyz") -> bytes:
     if n <= 0:
         return b""
+    tile = _ALPHABET_CACHE.get(alphabet)
+    if tile is None:
+        # whole repetitions only, so any prefix of the tile is a prefix of the infinite tiling
+        tile = alphabet * (_FILL_TILE_BYTES // len(alphabet) + 1)
+        _ALPHABET_CACHE[alphabet] = tile
+    if n <= len(tile):
+        return tile[:n]
     reps, rem = divmod(n, len(alphabet))
     return alphabet * reps + alphabet[:rem]
 
 
+# Full-size filler lines used by advance_to (MAX_LINE_TOTAL bytes each, newline included)
+FULL_LF_LINE = fill_bytes(MAX_LINE_TOTAL - 1, b"P") + b"\n"
+FULL_CRLF_LINE = fill_bytes(MAX_LINE_TOTAL - 2, b"P") + b"\r\n"
+
+
+_UTF8_TOKEN_CACHE: dict[str, bytes] = {}
+
+
 def utf8_fill_exact_bytes(n: int, token: str, ascii_fallback: bytes = b"a") -> bytes:
     """
     Produce exactly n bytes of VALID UTF-8 by repeating `token` and then padding with ASCII.
     """
     if n <= 0:
         return b""
-    tb = token.encode("utf-8")
-    k = n // len(tb)
-    out = tb * k
-    rem = n - len(out)
-    if rem:
-        out += fill_bytes(rem, ascii_fallback)
-    return out
+    tb = _UTF8_TOKEN_CACHE.get(token)
+    if tb is None:
+        tb = _UTF8_TOKEN_CACHE[token] = token.encode("utf-8")
+    k, rem = divmod(n, len(tb))
+    if rem == 0:
+        return tb * k
+    return tb * k + fill_bytes(rem, ascii_fallback)
+
+
+def utf8_trim_partial_tail(data: bytes) -> bytes:
+    """
+    Drop a codepoint cut off at the end of otherwise valid UTF-8 (no decode).
+    Walks back over at most 3 continuation bytes (10xxxxxx) to the lead byte.
+    """
+    n = len(data)
+    i = n - 1
+    while i >= 0 and n - i <= 3 and (data[i] & 0xC0) == 0x80:
+        i -= 1
+    if i < 0:
+        return data
+    lead = data[i]
+    if lead >= 0xF0:
+        need = 4
+    elif lead >= 0xE0:
+        need = 3
+    elif lead >= 0xC0:
+        need = 2
+    else:
+        need = 1
+    return data[:i] if n - i < need else data
 
 
 def write_line(f, content: bytes, newline: bytes) -> int:
@@ -52,48 +116,103 @@ def write_line(f, content: bytes, newline: bytes) -> int:
     """
     assert len(newline) in (1, 2)
     assert len(content) + len(newline) <= MAX_LINE_TOTAL
-    f.write(content)
-    f.write(newline)
-    return len(content) + len(newline)
+    buf = content + newline
+    f.write(buf)
+    return len(buf)
 
 
 def ensure_dir(p: Path) -> None:
     p.parent.mkdir(parents=True, exist_ok=True)
 
 
-def manifest_row(rows: list[str], name: str, newline: str, approx_size: int, desc: str) -> None:
-    rows.append(f"{name}\t{newline}\t{approx_size}\t{desc}")
+def manifest_row(rows: list[ManifestRow], name: str, newline: str, approx_size: int, desc: str) -> None:
+    rows.append((name, newline, approx_size, desc))
 
 
 def set_file_bytes_exact(path: Path, data: bytes) -> int:
     ensure_dir(path)
-    with path.open("wb") as f:
+    with path.open("wb", buffering=WRITE_BUF) as f:
         f.write(data)
     return len(data)
 
 
+def write_all(fd: int, data: bytes) -> None:
+    """
+    os.write until every byte of data is written (os.write may return short).
+    """
+    view = memoryview(data)
+    while view:
+        n = os.write(fd, view)
+        view = view[n:]
+
+
+def preallocate(fd: int, size: int) -> None:
+    """
+    Reserve the file's final size up front so the filesystem can hand out contiguous extents.
+    Best-effort: skipped where posix_fallocate is unavailable or unsupported by the filesystem.
+    """
+    if size <= 0 or not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except OSError:
+        pass
+
+
+def drop_page_cache(path: Path) -> None:
+    """
+    Ask the kernel to evict a finished file's pages; nothing reads them back during generation.
+    Best-effort: skipped where posix_fadvise is unavailable.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
 def stream_write_target(
     path: Path,
     target_bytes: int,
     make_bytes,
     desc: str,
     newline_label: str,
-    manifest: list[str],
+    manifest: list[ManifestRow],
 ) -> None:
     """
     Stream writer: repeatedly emits bytes until target_bytes reached exactly.
     `make_bytes(remaining_bytes)` must return a bytes object.
+    The first chunk is treated as the steady-state chunk and reused while it still fits, so
+    `make_bytes` must return that same content for any `remaining_bytes >= len(chunk)`;
+    it is only called again for the tail.
+    Chunks are already multi-MiB, so they go straight to os.write on a raw fd
+    instead of being copied through a BufferedWriter first.
     """
     ensure_dir(path)
     written = 0
-    with path.open("wb", buffering=1024 * 1024) as f:
+    steady = b""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        preallocate(fd, target_bytes)
         while written < target_bytes:
             remaining = target_bytes - written
-            chunk = make_bytes(remaining)
+            if steady and remaining >= len(steady):
+                chunk = steady
+            else:
+                chunk = make_bytes(remaining)
+                if not steady:
+                    steady = chunk
             if not chunk:
                 raise RuntimeError(f"make_bytes returned empty at written={written}")
-            f.write(chunk)
+            write_all(fd, chunk)
             written += len(chunk)
+    finally:
+        os.close(fd)
+    drop_page_cache(path)
     manifest_row(manifest, path.name, newline_label, written, desc)
 
 
@@ -107,6 +226,14 @@ def advance_to(f, written: int, target_written: int, newline: bytes) -> int:
     max_content = MAX_LINE_TOTAL - nl_len  # 4095 for LF, 4094 for CRLF
     remaining = target_written - written
 
+    # Bulk-emit all but the last full-size filler line in one write; the loop below still takes
+    # that last one so the CRLF "leave 2, not 1" adjustment stays in a single place.
+    n_full = max(0, (remaining - 1) // MAX_LINE_TOTAL - 1)
+    if n_full:
+        f.write((FULL_LF_LINE if nl_len == 1 else FULL_CRLF_LINE) * n_full)
+        written += n_full * MAX_LINE_TOTAL
+        remaining = target_written - written
+
     while remaining > 0:
         if remaining > MAX_LINE_TOTAL:
             step = MAX_LINE_TOTAL
@@ -138,12 +265,12 @@ def advance_to(f, written: int, target_written: int, newline: bytes) -> int:
 # -----------------------------
 # Boundary builders (absolute offsets)
 # -----------------------------
-def make_newline_at_offset_lf(path: Path, newline_at: int, desc: str, manifest: list[str]) -> None:
+def make_newline_at_offset_lf(path: Path, newline_at: int, desc: str, manifest: list[ManifestRow]) -> None:
     """
     Create an LF file where a line ends with '\\n' exactly at absolute index newline_at.
     """
     ensure_dir(path)
-    with path.open("wb") as f:
+    with path.open("wb", buffering=WRITE_BUF) as f:
         written = 0
         max_content = MAX_LINE_TOTAL - 1  # 4095
         # We need content_len = newline_at - written <= 4095 => written >= newline_at - 4095
@@ -160,12 +287,12 @@ def make_newline_at_offset_lf(path: Path, newline_at: int, desc: str, manifest:
     manifest_row(manifest, path.name, "LF", path.stat().st_size, desc)
 
 
-def make_crlf_split_across_boundary(path: Path, cr_at: int, desc: str, manifest: list[str]) -> None:
+def make_crlf_split_across_boundary(path: Path, cr_at: int, desc: str, manifest: list[ManifestRow]) -> None:
     """
     Create a CRLF file where '\r' is at absolute index cr_at and '\n' at cr_at+1.
     """
     ensure_dir(path)
-    with path.open("wb") as f:
+    with path.open("wb", buffering=WRITE_BUF) as f:
         written = 0
         nl = b"\r\n"
         nl_len = 2
@@ -224,13 +351,13 @@ def write_utf8_split_line_abs(f, written: int, split_offset: int, token_bytes: b
 
 
 
-def make_utf8_split_file(path: Path, split_offsets: list[int], token: str, desc: str, manifest: list[str]) -> None:
+def make_utf8_split_file(path: Path, split_offsets: list[int], token: str, desc: str, manifest: list[ManifestRow]) -> None:
     """
     Create an LF file with one or more lines, each placing `token` at the specified absolute offset.
     """
     ensure_dir(path)
     token_bytes = token.encode("utf-8")
-    with path.open("wb") as f:
+    with path.open("wb", buffering=WRITE_BUF) as f:
         written = 0
         for off in split_offsets:
             written = write_utf8_split_line_abs(f, written, off, token_bytes, b"\n")
@@ -238,14 +365,15 @@ def make_utf8_split_file(path: Path, split_offsets: list[int], token: str, desc:
     manifest_row(manifest, path.name, "LF", path.stat().st_size, desc)
 
 
-def make_eof_exact_multiple_of_buf_no_newline(path: Path, total_bytes: int, desc: str, manifest: list[str]) -> None:
+def make_eof_exact_multiple_of_buf_no_newline(path: Path, total_bytes: int, desc: str, manifest: list[ManifestRow]) -> None:
     """
     File ends exactly at multiple of BUF_SIZE with NO final newline.
     Keeps per-line max constraint by ensuring the final EOF line length <= MAX_LINE_TOTAL.
     """
     assert total_bytes % BUF_SIZE == 0
     ensure_dir(path)
-    with path.open("wb") as f:
+    with path.open("wb", buffering=WRITE_BUF) as f:
+        preallocate(f.fileno(), total_bytes)
         written = 0
         newline = b"\n"
         max_line_with_nl = MAX_LINE_TOTAL          # 4096 (content+newline)
@@ -279,17 +407,18 @@ def make_eof_exact_multiple_of_buf_no_newline(path: Path, total_bytes: int, desc
 
         assert written == total_bytes
 
+    drop_page_cache(path)
     manifest_row(manifest, path.name, "LF(no-final-nl)", path.stat().st_size, desc)
 
 
 
-def make_eof_no_newline_multibyte_end(path: Path, desc: str, manifest: list[str]) -> None:
+def make_eof_no_newline_multibyte_end(path: Path, desc: str, manifest: list[ManifestRow]) -> None:
     """
     EOF without newline, last bytes are a multi-byte UTF-8 codepoint.
     """
     token = "😀".encode("utf-8")  # 4 bytes
     ensure_dir(path)
-    with path.open("wb") as f:
+    with path.open("wb", buffering=WRITE_BUF) as f:
         for _ in range(50):
             write_line(f, b"prefix", b"\n")
         content = fill_bytes(200, b"Z") + token
@@ -302,36 +431,42 @@ def make_eof_no_newline_multibyte_end(path: Path, desc: str, manifest: list[str]
 # -----------------------------
 # Suite generators (35 + optional 36)
 # -----------------------------
-manifest = ["name\tnewline\tbytes\tdescription"]
-
-
-def gen_01_empty():
+def gen_01_empty() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "01_empty.txt"
     size = set_file_bytes_exact(p, b"")
-    manifest_row(manifest, p.name, "N/A", size, "Empty file")
+    manifest_row(rows, p.name, "N/A", size, "Empty file")
+    return rows
 
 
-def gen_02_one_byte():
+def gen_02_one_byte() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "02_one_byte_no_newline.txt"
     size = set_file_bytes_exact(p, b"a")
-    manifest_row(manifest, p.name, "N/A", size, "Single byte, no newline")
+    manifest_row(rows, p.name, "N/A", size, "Single byte, no newline")
+    return rows
 
 
-def gen_03_only_newlines():
+def gen_03_only_newlines() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "03_only_newlines_lf.txt"
     size = set_file_bytes_exact(p, b"\n" * 32)
-    manifest_row(manifest, p.name, "LF", size, "Only newlines (empty lines)")
+    manifest_row(rows, p.name, "LF", size, "Only newlines (empty lines)")
+    return rows
 
 
-def gen_04_fixed_len8_1000():
+def gen_04_fixed_len8_1000() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "04_fixed_len8_1000_lines_crlf.txt"
-    with p.open("wb") as f:
-        for _ in range(1000):
-            write_line(f, fill_bytes(8, b"abcd"), b"\r\n")
-    manifest_row(manifest, p.name, "CRLF", p.stat().st_size, "1000 lines, content length 8 (CRLF)")
+    line = fill_bytes(8, b"abcd") + b"\r\n"
+    with p.open("wb", buffering=WRITE_BUF) as f:
+        f.write(line * 1000)
+    manifest_row(rows, p.name, "CRLF", p.stat().st_size, "1000 lines, content length 8 (CRLF)")
+    return rows
 
 
-def gen_05_mixed_whitespace():
+def gen_05_mixed_whitespace() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "05_mixed_whitespace_lf.txt"
     lines = [
         b"    leading spaces",
@@ -343,217 +478,236 @@ def gen_05_mixed_whitespace():
         b"  \t  ",
         b"end",
     ]
-    with p.open("wb") as f:
-        for _ in range(200):
-            for ln in lines:
-                write_line(f, ln, b"\n")
-    manifest_row(manifest, p.name, "LF", p.stat().st_size, "Whitespace stress: tabs/leading/trailing/empty lines")
+    block = b"".join(ln + b"\n" for ln in lines)
+    with p.open("wb", buffering=WRITE_BUF) as f:
+        f.write(block * 200)
+    manifest_row(rows, p.name, "LF", p.stat().st_size, "Whitespace stress: tabs/leading/trailing/empty lines")
+    return rows
 
 
-def gen_06_no_final_newline():
+def gen_06_no_final_newline() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "06_no_final_newline_lf.txt"
-    with p.open("wb") as f:
-        for i in range(2000):
-            f.write(b"line-" + str(i).encode("ascii") + b"\n")
-        f.write(b"last-line-no-newline")  # no final newline
-    manifest_row(manifest, p.name, "LF(no-final-nl)", p.stat().st_size, "No final newline (EOF-terminated last line)")
+    data = b"\n".join(b"line-%d" % i for i in range(2000)) + b"\nlast-line-no-newline"  # no final newline
+    size = set_file_bytes_exact(p, data)
+    manifest_row(rows, p.name, "LF(no-final-nl)", size, "No final newline (EOF-terminated last line)")
+    return rows
 
 
-def gen_07_monotonic_increasing():
+def gen_07_monotonic_increasing() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "07_monotonic_increasing_1_to_4095_lf.txt"
-    with p.open("wb") as f:
-        for L in range(1, 4096):
-            write_line(f, fill_bytes(L, b"qwertyuiop"), b"\n")
-    manifest_row(manifest, p.name, "LF", p.stat().st_size, "Monotonic increasing line lengths (1..4095)")
+    master = fill_bytes(4095, b"qwertyuiop")  # every line is a prefix of this
+    with p.open("wb", buffering=WRITE_BUF) as f:
+        f.writelines(master[:L] + b"\n" for L in range(1, 4096))
+    manifest_row(rows, p.name, "LF", p.stat().st_size, "Monotonic increasing line lengths (1..4095)")
+    return rows
 
 
-def gen_08_uniform_random_lengths_seeded():
+def gen_08_uniform_random_lengths_seeded() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "08_uniform_random_lengths_seeded_lf.txt"
     rng = random.Random(0xDEC0DE)
-    with p.open("wb") as f:
-        for _ in range(20000):
-            L = rng.randint(1, 4095)
-            write_line(f, fill_bytes(L, b"RANDOM"), b"\n")
-    manifest_row(manifest, p.name, "LF", p.stat().st_size, "Uniform random line lengths in [1..4095] (seeded)")
+    randint = rng.randint
+    lengths = [randint(1, 4095) for _ in range(20000)]
+    master = fill_bytes(4095, b"RANDOM")
+    with p.open("wb", buffering=WRITE_BUF) as f:
+        f.writelines(master[:L] + b"\n" for L in lengths)
+    manifest_row(rows, p.name, "LF", p.stat().st_size, "Uniform random line lengths in [1..4095] (seeded)")
+    return rows
 
 
-def gen_09_sawtooth():
+def gen_09_sawtooth() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "09_sawtooth_1_to_4095_repeat_crlf.txt"
-    with p.open("wb") as f:
-        max_content = 4094
+    max_content = 4094
+    master = fill_bytes(max_content, b"SAW")
+    sweep = b"".join(master[:L] + b"\r\n" for L in range(1, max_content + 1))  # ~8 MiB, built once
+    with p.open("wb", buffering=WRITE_BUF) as f:
         for _ in range(8):
-            for L in range(1, max_content + 1):
-                write_line(f, fill_bytes(L, b"SAW"), b"\r\n")
-    manifest_row(manifest, p.name, "CRLF", p.stat().st_size, "Sawtooth lengths (1..4094) repeated (CRLF)")
+            f.write(sweep)
+    manifest_row(rows, p.name, "CRLF", p.stat().st_size, "Sawtooth lengths (1..4094) repeated (CRLF)")
+    return rows
 
 
-def gen_10_alternating_8_4095():
+def gen_10_alternating_8_4095() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "10_alternating_8_and_4095_lf.txt"
-    with p.open("wb") as f:
-        for _ in range(5000):
-            write_line(f, fill_bytes(8, b"alt8"), b"\n")
-            write_line(f, fill_bytes(4095, b"ALT4095"), b"\n")
-    manifest_row(manifest, p.name, "LF", p.stat().st_size, "Alternating line lengths 8 and 4095 (allocation stress)")
+    pair = fill_bytes(8, b"alt8") + b"\n" + fill_bytes(4095, b"ALT4095") + b"\n"
+    with p.open("wb", buffering=WRITE_BUF) as f:
+        f.write(pair * 5000)
+    manifest_row(rows, p.name, "LF", p.stat().st_size, "Alternating line lengths 8 and 4095 (allocation stress)")
+    return rows
 
 
-def gen_11_bimodal_90_10():
+def gen_11_bimodal_90_10() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "11_bimodal_90pct_8_10pct_4095_lf.txt"
     rng = random.Random(0xC0FFEE)
-    with p.open("wb") as f:
-        for _ in range(20000):
-            if rng.random() < 0.90:
-                write_line(f, fill_bytes(8, b"tiny"), b"\n")
-            else:
-                write_line(f, fill_bytes(4095, b"huge"), b"\n")
-    manifest_row(manifest, p.name, "LF", p.stat().st_size, "Bimodal: 90% len=8, 10% len=4095")
+    tiny = fill_bytes(8, b"tiny") + b"\n"
+    huge = fill_bytes(4095, b"huge") + b"\n"
+    rand = rng.random
+    with p.open("wb", buffering=WRITE_BUF) as f:
+        f.writelines(tiny if rand() < 0.90 else huge for _ in range(20000))
+    manifest_row(rows, p.name, "LF", p.stat().st_size, "Bimodal: 90% len=8, 10% len=4095")
+    return rows
 
 
-def gen_12_burst():
+def gen_12_burst() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "12_burst_tiny_then_huge_then_tiny_lf.txt"
-    with p.open("wb") as f:
-        for _ in range(10000):
-            write_line(f, b"x" * 8, b"\n")
-        for _ in range(200):
-            write_line(f, b"y" * 4095, b"\n")
-        for _ in range(10000):
-            write_line(f, b"z" * 8, b"\n")
-    manifest_row(manifest, p.name, "LF", p.stat().st_size, "Burst: 10k tiny, 200 huge, 10k tiny")
+    with p.open("wb", buffering=WRITE_BUF) as f:
+        f.write((b"x" * 8 + b"\n") * 10000)
+        f.write((b"y" * 4095 + b"\n") * 200)
+        f.write((b"z" * 8 + b"\n") * 10000)
+    manifest_row(rows, p.name, "LF", p.stat().st_size, "Burst: 10k tiny, 200 huge, 10k tiny")
+    return rows
 
 
-def gen_13_single_max_with_newline():
+def gen_13_single_max_with_newline() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "13_single_max_line_with_newline_lf.txt"
     size = set_file_bytes_exact(p, b"A" * 4095 + b"\n")
-    manifest_row(manifest, p.name, "LF", size, "Single max line (4095 content) + newline")
+    manifest_row(rows, p.name, "LF", size, "Single max line (4095 content) + newline")
+    return rows
 
 
-def gen_14_single_max_no_newline():
+def gen_14_single_max_no_newline() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "14_single_max_line_no_newline_eof.txt"
     size = set_file_bytes_exact(p, b"B" * 4096)
-    manifest_row(manifest, p.name, "LF(no-final-nl)", size, "Single max EOF line (4096 bytes), no newline")
+    manifest_row(rows, p.name, "LF(no-final-nl)", size, "Single max EOF line (4096 bytes), no newline")
+    return rows
 
 
-def gen_15_many_tiny_lines():
+def gen_15_many_tiny_lines() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "15_many_tiny_lines_len1_lf.txt"
-    with p.open("wb", buffering=1024 * 1024) as f:
-        line = b"x\n"
-        block = line * 4096
-        blocks = 5_000_000 // 4096
-        rem = 5_000_000 % 4096
-        for _ in range(blocks):
-            f.write(block)
-        f.write(line * rem)
-    manifest_row(manifest, p.name, "LF", p.stat().st_size, "Many tiny lines (5,000,000 lines of 'x')")
-
-
-def gen_16_few_huge_lines():
+    size = set_file_bytes_exact(p, b"x\n" * 5_000_000)  # 10 MB, one allocation + one write
+    manifest_row(rows, p.name, "LF", size, "Many tiny lines (5,000,000 lines of 'x')")
+    return rows
+
+
+def gen_16_few_huge_lines() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "16_few_huge_lines_10000_lf.txt"
-    with p.open("wb", buffering=1024 * 1024) as f:
+    with p.open("wb", buffering=WRITE_BUF) as f:
         line = b"H" * 4095 + b"\n"
-        for _ in range(10_000):
-            f.write(line)
-    manifest_row(manifest, p.name, "LF", p.stat().st_size, "Few huge lines (10,000 lines of 4095 bytes)")
+        f.write(line * 10_000)  # ~40 MiB, fine to build in memory
+    manifest_row(rows, p.name, "LF", p.stat().st_size, "Few huge lines (10,000 lines of 4095 bytes)")
+    return rows
 
 
-def gen_17_utf8_2byte_heavy():
+def gen_17_utf8_2byte_heavy() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "17_utf8_2byte_heavy_lf.txt"
-    with p.open("wb") as f:
-        for L in range(16, 4096, 17):
-            write_line(f, utf8_fill_exact_bytes(L, "é"), b"\n")
-    manifest_row(manifest, p.name, "LF", p.stat().st_size, "UTF-8 2-byte heavy (é)")
+    with p.open("wb", buffering=WRITE_BUF) as f:
+        f.writelines(utf8_fill_exact_bytes(L, "é") + b"\n" for L in range(16, 4096, 17))
+    manifest_row(rows, p.name, "LF", p.stat().st_size, "UTF-8 2-byte heavy (é)")
+    return rows
 
 
-def gen_18_utf8_3byte_heavy():
+def gen_18_utf8_3byte_heavy() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "18_utf8_3byte_heavy_lf.txt"
-    with p.open("wb") as f:
-        for L in range(16, 4096, 19):
-            write_line(f, utf8_fill_exact_bytes(L, "中"), b"\n")
-    manifest_row(manifest, p.name, "LF", p.stat().st_size, "UTF-8 3-byte heavy (CJK)")
+    with p.open("wb", buffering=WRITE_BUF) as f:
+        f.writelines(utf8_fill_exact_bytes(L, "中") + b"\n" for L in range(16, 4096, 19))
+    manifest_row(rows, p.name, "LF", p.stat().st_size, "UTF-8 3-byte heavy (CJK)")
+    return rows
 
 
-def gen_19_utf8_4byte_heavy():
+def gen_19_utf8_4byte_heavy() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "19_utf8_4byte_heavy_lf.txt"
-    with p.open("wb") as f:
-        for L in range(16, 4096, 23):
-            write_line(f, utf8_fill_exact_bytes(L, "😀"), b"\n")
-    manifest_row(manifest, p.name, "LF", p.stat().st_size, "UTF-8 4-byte heavy (emoji)")
+    with p.open("wb", buffering=WRITE_BUF) as f:
+        f.writelines(utf8_fill_exact_bytes(L, "😀") + b"\n" for L in range(16, 4096, 23))
+    manifest_row(rows, p.name, "LF", p.stat().st_size, "UTF-8 4-byte heavy (emoji)")
+    return rows
 
 
-def gen_20_utf8_mixed_per_line():
+def gen_20_utf8_mixed_per_line() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "20_utf8_mixed_per_line_lf.txt"
     token = "ASCII é 中 😀 | ".encode("utf-8")
-    with p.open("wb") as f:
+    with p.open("wb", buffering=WRITE_BUF) as f:
         for L in range(32, 4096, 37):
             reps = max(1, L // len(token))
-            content = (token * reps)[:L]
-            while True:
-                try:
-                    content.decode("utf-8")
-                    break
-                except UnicodeDecodeError:
-                    content = content[:-1]
+            content = utf8_trim_partial_tail((token * reps)[:L])
             content = content + fill_bytes(L - len(content), b"_")
             write_line(f, content, b"\n")
-    manifest_row(manifest, p.name, "LF", p.stat().st_size, "Mixed UTF-8 in each line")
+    manifest_row(rows, p.name, "LF", p.stat().st_size, "Mixed UTF-8 in each line")
+    return rows
 
 
-def gen_21_utf8_combining_marks():
+def gen_21_utf8_combining_marks() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "21_utf8_combining_marks_lf.txt"
-    with p.open("wb") as f:
-        for L in range(32, 4096, 31):
-            write_line(f, utf8_fill_exact_bytes(L, "e\u0301"), b"\n")
-    manifest_row(manifest, p.name, "LF", p.stat().st_size, "Combining marks (grapheme clusters)")
+    with p.open("wb", buffering=WRITE_BUF) as f:
+        f.writelines(utf8_fill_exact_bytes(L, "e\u0301") + b"\n" for L in range(32, 4096, 31))
+    manifest_row(rows, p.name, "LF", p.stat().st_size, "Combining marks (grapheme clusters)")
+    return rows
 
 
-def gen_22_utf8_zwj_sequences():
+def gen_22_utf8_zwj_sequences() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "22_utf8_zwj_sequences_lf.txt"
     seq = "👨‍👩‍👧‍👦"
-    with p.open("wb") as f:
-        for L in range(64, 4096, 41):
-            write_line(f, utf8_fill_exact_bytes(L, seq), b"\n")
-    manifest_row(manifest, p.name, "LF", p.stat().st_size, "ZWJ emoji sequences")
+    with p.open("wb", buffering=WRITE_BUF) as f:
+        f.writelines(utf8_fill_exact_bytes(L, seq) + b"\n" for L in range(64, 4096, 41))
+    manifest_row(rows, p.name, "LF", p.stat().st_size, "ZWJ emoji sequences")
+    return rows
 
 
-def gen_23_boundary_newline_at_buf_minus_1():
+def gen_23_boundary_newline_at_buf_minus_1() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     off = BUF_SIZE - 1
     make_newline_at_offset_lf(
         OUT_DIR / f"23_boundary_newline_at_offset_{off}_lf.txt",
         newline_at=off,
         desc=f"Boundary: '\\n' at absolute offset {off} (chunk end for BUF_SIZE={BUF_SIZE})",
-        manifest=manifest,
+        manifest=rows,
     )
+    return rows
 
 
-def gen_24_boundary_newline_at_buf_minus_2():
+def gen_24_boundary_newline_at_buf_minus_2() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     off = BUF_SIZE - 2
     make_newline_at_offset_lf(
         OUT_DIR / f"24_boundary_newline_at_offset_{off}_lf.txt",
         newline_at=off,
         desc=f"Boundary: '\\n' at absolute offset {off} (one before chunk end for BUF_SIZE={BUF_SIZE})",
-        manifest=manifest,
+        manifest=rows,
     )
+    return rows
 
 
-def gen_25_boundary_newline_at_buf_exact():
+def gen_25_boundary_newline_at_buf_exact() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     off = BUF_SIZE
     make_newline_at_offset_lf(
         OUT_DIR / f"25_boundary_newline_at_offset_{off}_lf.txt",
         newline_at=off,
         desc=f"Boundary: '\\n' at absolute offset {off} (first byte of next chunk for BUF_SIZE={BUF_SIZE})",
-        manifest=manifest,
+        manifest=rows,
     )
+    return rows
 
 
-def gen_26_boundary_crlf_split():
+def gen_26_boundary_crlf_split() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     cr_at = BUF_SIZE - 1
     make_crlf_split_across_boundary(
         OUT_DIR / f"26_boundary_crlf_split_cr_at_{cr_at}.txt",
         cr_at=cr_at,
         desc=f"Boundary: CRLF split across chunks (\\r at {cr_at}, \\n at {cr_at+1}) for BUF_SIZE={BUF_SIZE}",
-        manifest=manifest,
+        manifest=rows,
     )
+    return rows
 
 
-def gen_27_boundary_utf8_2byte_split():
+def gen_27_boundary_utf8_2byte_split() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     # place 'é' such that it starts at BUF_SIZE-1 (1+1 split)
     split = BUF_SIZE - 1
     make_utf8_split_file(
@@ -561,11 +715,13 @@ def gen_27_boundary_utf8_2byte_split():
         split_offsets=[split],
         token="é",
         desc=f"Boundary: UTF-8 2-byte codepoint split across chunks (é), start at {split} for BUF_SIZE={BUF_SIZE}",
-        manifest=manifest,
+        manifest=rows,
     )
+    return rows
 
 
-def gen_28_boundary_utf8_3byte_splits():
+def gen_28_boundary_utf8_3byte_splits() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     # 1+2 split at BUF_SIZE-1, 2+1 split at 2*BUF_SIZE-2
     split1 = BUF_SIZE - 1
     split2 = 2 * BUF_SIZE - 2
@@ -574,11 +730,13 @@ def gen_28_boundary_utf8_3byte_splits():
         split_offsets=[split1, split2],
         token="中",
         desc=f"Boundary: UTF-8 3-byte splits (1+2 at {split1}, 2+1 at {split2}) for BUF_SIZE={BUF_SIZE}",
-        manifest=manifest,
+        manifest=rows,
     )
+    return rows
 
 
-def gen_29_boundary_utf8_4byte_splits():
+def gen_29_boundary_utf8_4byte_splits() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     # 1+3 at BUF_SIZE-1, 2+2 at 2*BUF_SIZE-2, 3+1 at 3*BUF_SIZE-3
     split1 = BUF_SIZE - 1
     split2 = 2 * BUF_SIZE - 2
@@ -588,30 +746,36 @@ def gen_29_boundary_utf8_4byte_splits():
         split_offsets=[split1, split2, split3],
         token="😀",
         desc=f"Boundary: UTF-8 4-byte splits (1+3 at {split1}, 2+2 at {split2}, 3+1 at {split3}) for BUF_SIZE={BUF_SIZE}",
-        manifest=manifest,
+        manifest=rows,
     )
+    return rows
 
 
-def gen_30_boundary_eof_exact_multiple_of_buf():
+def gen_30_boundary_eof_exact_multiple_of_buf() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "30_boundary_eof_exact_multiple_of_buf_no_final_newline.txt"
     make_eof_exact_multiple_of_buf_no_newline(
         p,
         total_bytes=BUF_SIZE * 4,
         desc=f"EOF: file size exactly multiple of BUF_SIZE ({BUF_SIZE*4} bytes), no final newline",
-        manifest=manifest,
+        manifest=rows,
     )
+    return rows
 
 
-def gen_31_boundary_eof_no_newline_multibyte_end():
+def gen_31_boundary_eof_no_newline_multibyte_end() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "31_boundary_eof_no_newline_multibyte_at_end.txt"
     make_eof_no_newline_multibyte_end(
         p,
         desc="EOF: no final newline, last bytes are a multi-byte UTF-8 codepoint (😀)",
-        manifest=manifest,
+        manifest=rows,
     )
+    return rows
 
 
-def gen_32_large_64MiB_medium_lines():
+def gen_32_large_64MiB_medium_lines() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "32_large_64MiB_medium_lines_256_lf.txt"
     target = 64 * MiB
     line = fill_bytes(256, b"MED") + b"\n"  # 257 bytes
@@ -628,11 +792,13 @@ def gen_32_large_64MiB_medium_lines():
         p, target, make,
         desc="Large: 64 MiB total, ~256-byte lines (LF)",
         newline_label="LF",
-        manifest=manifest,
+        manifest=rows,
     )
+    return rows
 
 
-def gen_33_large_256MiB_tiny_lines():
+def gen_33_large_256MiB_tiny_lines() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "33_large_256MiB_tiny_lines_8_lf.txt"
     target = 256 * MiB
     line = fill_bytes(8, b"TINY") + b"\n"  # 9 bytes
@@ -649,11 +815,13 @@ def gen_33_large_256MiB_tiny_lines():
         p, target, make,
         desc="Large: 256 MiB total, tiny ~8-byte lines (LF)",
         newline_label="LF",
-        manifest=manifest,
+        manifest=rows,
     )
+    return rows
 
 
-def gen_34_large_256MiB_huge_lines():
+def gen_34_large_256MiB_huge_lines() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "34_large_256MiB_huge_lines_4095_lf.txt"
     target = 256 * MiB
     line = (b"H" * 4095) + b"\n"  # 4096 bytes
@@ -671,31 +839,43 @@ def gen_34_large_256MiB_huge_lines():
         p, target, make,
         desc="Large: 256 MiB total, huge ~4095-byte lines (LF)",
         newline_label="LF",
-        manifest=manifest,
+        manifest=rows,
     )
+    return rows
 
 
-def gen_35_mixed_newlines_lf_crlf():
+def gen_35_mixed_newlines_lf_crlf() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "35_mixed_newlines_lf_and_crlf.txt"
     rng = random.Random(0xBADC0DE)
-    with p.open("wb", buffering=1024 * 1024) as f:
+    rand = rng.random
+    randint = rng.randint
+    master = fill_bytes(MAX_LINE_TOTAL - 1, b"MIXED")
+
+    # Same draw order as one-line-at-a-time generation, so the seeded output is unchanged.
+    def lines():
         for i in range(200000):
-            use_crlf = (i % 7 == 0) or (rng.random() < 0.15)
+            use_crlf = (i % 7 == 0) or (rand() < 0.15)
             nl = b"\r\n" if use_crlf else b"\n"
             max_content = MAX_LINE_TOTAL - len(nl)
-            r = rng.random()
+            r = rand()
             if r < 0.80:
-                L = rng.randint(1, min(256, max_content))
+                L = randint(1, min(256, max_content))
             elif r < 0.98:
-                L = rng.randint(257, min(2048, max_content))
+                L = randint(257, min(2048, max_content))
             else:
-                L = rng.randint(max(1, max_content - 64), max_content)
-            write_line(f, fill_bytes(L, b"MIXED"), nl)
-    manifest_row(manifest, p.name, "MIXED(LF+CRLF)", p.stat().st_size, "Mixed newline styles (LF + CRLF) with varied line lengths")
+                L = randint(max(1, max_content - 64), max_content)
+            yield master[:L] + nl
+
+    with p.open("wb", buffering=WRITE_BUF) as f:
+        f.writelines(lines())
+    manifest_row(rows, p.name, "MIXED(LF+CRLF)", p.stat().st_size, "Mixed newline styles (LF + CRLF) with varied line lengths")
+    return rows
 
 
 # Optional 36th file: 1 GiB mixed/bimodal (enable with GEN_1G=1)
-def gen_36_huge_1GiB_mixed_bimodal():
+def gen_36_huge_1GiB_mixed_bimodal() -> list[ManifestRow]:
+    rows: list[ManifestRow] = []
     p = OUT_DIR / "36_huge_1GiB_mixed_bimodal_lf.txt"
     target = 1024 * MiB  # 1 GiB
     small = fill_bytes(64, b"s") + b"\n"
@@ -717,8 +897,24 @@ def gen_36_huge_1GiB_mixed_bimodal():
         p, target, make,
         desc="Extra: 1 GiB total, mixed bimodal (64-byte lines interleaved with 4095-byte lines)",
         newline_label="LF",
-        manifest=manifest,
+        manifest=rows,
     )
+    return rows
+
+
+def _gen_matches(name: str, selectors: list[str]) -> bool:
+    return any(name == sel or name.startswith(sel + "_") for sel in selectors)
+
+
+def _run_one(fn) -> list[ManifestRow]:
+    return fn()
+
+
+def _mp_context():
+    # fork avoids re-importing this module (and re-reading the env config) in every worker
+    if sys.platform.startswith("linux"):
+        return multiprocessing.get_context("fork")
+    return None
 
 
 def main() -> None:
@@ -767,11 +963,21 @@ def main() -> None:
     if os.environ.get("GEN_1G") == "1":
         gens.append(gen_36_huge_1GiB_mixed_bimodal)
 
-    for fn in gens:
-        fn()
+    gens = [
+        g for g in gens
+        if (not GEN_ONLY or _gen_matches(g.__name__, GEN_ONLY)) and not _gen_matches(g.__name__, GEN_SKIP)
+    ]
+
+    # Generators write distinct files, so they run in parallel; map() keeps manifest rows in suite order.
+    manifest: list[ManifestRow] = []
+    with ProcessPoolExecutor(max_workers=GEN_JOBS, mp_context=_mp_context()) as ex:
+        for rows in ex.map(_run_one, gens):
+            manifest.extend(rows)
 
     manifest_path = OUT_DIR / "MANIFEST.tsv"
-    manifest_path.write_text("\n".join(manifest) + "\n", encoding="utf-8")
+    with manifest_path.open("w", encoding="utf-8", newline="\n") as mf:
+        mf.write("name\tnewline\tbytes\tdescription\n")
+        mf.writelines(f"{name}\t{nl}\t{size}\t{desc}\n" for name, nl, size, desc in manifest)
 
     print(f"BUF_SIZE={BUF_SIZE}")
     print(f"Generated {len(gens)} files in: {OUT_DIR}")
@@ -2,7 +2,72 @@
 from __future__ import annotations
 
 import argparse
+import array
+import asyncio
+import ctypes
+import fnmatch
+import io
+import mmap
+import operator
+import os
+import stat
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Callable, Iterator
+
+READ_BUF = 1 << 22  # read size for files that can't be mmap'd
+ASCII_BLOCK = 1 << 20  # bulk-compare unit; each block is extended to the next newline
+
+
+def _pick_reverse_ascii() -> Callable[[bytes], bytes]:
+    """Time the candidate byte reversals once on typical line lengths and return the fastest.
+    All candidates give identical results for ASCII content; only speed differs between CPython builds.
+    """
+    def via_array(b: bytes) -> bytes:
+        a = array.array("B", b)
+        a.reverse()
+        return a.tobytes()
+
+    def via_reversed(b: bytes) -> bytes:
+        return bytes(reversed(b))
+
+    # the slice as a C callable: no Python frame per call, and usable with map()
+    via_slice = operator.itemgetter(slice(None, None, -1))
+    samples = [b"x" * n for n in (8, 80, 1000)]
+
+    def cost(fn: Callable[[bytes], bytes]) -> float:
+        best = float("inf")
+        for _ in range(3):
+            t0 = time.perf_counter()
+            for _ in range(20):
+                for sample in samples:
+                    fn(sample)
+            best = min(best, time.perf_counter() - t0)
+        return best
+
+    return min((via_slice, via_array, via_reversed), key=cost)
+
+
+_reverse_ascii = _pick_reverse_ascii()
+
+
+def _load_native_kernel() -> Callable[[bytes, bytes, int], int] | None:
+    """verify_ascii_reversed() from _verify_ext.so next to this script, or None to stay in pure Python.
+    Build it with the command at the top of _verify_ext.c.
+    """
+    try:
+        lib = ctypes.CDLL(os.path.join(os.path.dirname(os.path.abspath(__file__)), "_verify_ext.so"))
+    except OSError:
+        return None
+    fn = lib.verify_ascii_reversed
+    fn.argtypes = (ctypes.c_char_p, ctypes.c_char_p, ctypes.c_size_t)
+    fn.restype = ctypes.c_size_t
+    return fn
+
+
+_native_verify_ascii = _load_native_kernel()
 
 
 def reverse_line_bytes(line: bytes) -> bytes:
@@ -12,13 +77,20 @@ def reverse_line_bytes(line: bytes) -> bytes:
     eol = b""
     content = line
 
-    if line.endswith(b"\n"):
-        if line.endswith(b"\r\n"):
+    # byte probes (int compares) instead of endswith calls
+    n = len(line)
+    if n and line[n - 1] == 0x0A:
+        if n >= 2 and line[n - 2] == 0x0D:
             eol = b"\r\n"
-            content = line[:-2]
+            content = line[:n - 2]
         else:
             eol = b"\n"
-            content = line[:-1]
+            content = line[:n - 1]
+
+    if content.isascii():
+        # no multi-byte code points: byte reverse == code point reverse, skip decode/encode
+        rev = _reverse_ascii(content)
+        return rev + eol if eol else rev
 
     try:
         s = content.decode("utf-8")
@@ -26,26 +98,345 @@ def reverse_line_bytes(line: bytes) -> bytes:
     except UnicodeDecodeError:
         rev = content[::-1]
 
-    return rev + eol
+    # no EOL (last line without newline): rev is already the result, skip the concat copy
+    return rev + eol if eol else rev
+
+
+def expected_len_fast(in_line: bytes) -> int:
+    """Byte length of reverse_line_bytes(in_line) without building it.
+    Both reverse paths (code points or raw bytes) keep every byte and the EOL, so it is len(in_line).
+    """
+    return len(in_line)
 
 
 def first_mismatch(a: bytes, b: bytes) -> int:
+    """Index of the first differing byte, len of the shorter on a pure prefix, -1 if equal.
+    Bisects with bytes equality (a C memcmp per step) down to one 8-byte word, then
+    locates the byte inside it from the lowest set bit of the little-endian XOR.
+    """
     n = min(len(a), len(b))
-    for i in range(n):
-        if a[i] != b[i]:
-            return i
-    return n if len(a) != len(b) else -1
+    if a[:n] == b[:n]:
+        return n if len(a) != len(b) else -1
+    # invariant: a[:lo] == b[:lo] and the first difference lies in [lo, hi)
+    lo, hi = 0, n
+    while hi - lo > 8:
+        mid = (lo + hi) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid
+    x = int.from_bytes(a[lo:hi], "little") ^ int.from_bytes(b[lo:hi], "little")
+    return lo + ((x & -x).bit_length() - 1) // 8
+
+
+_PREVIEW_ESCAPES = str.maketrans({"\n": "\\n", "\r": "\\r"})
 
 
 def preview(x: bytes, i: int, w: int = 40) -> str:
     lo = max(0, i - w)
     hi = min(len(x), i + w)
-    return (
-        x[lo:hi]
-        .decode("utf-8", errors="replace")
-        .replace("\n", "\\n")
-        .replace("\r", "\\r")
-    )
+    return x[lo:hi].decode("utf-8", errors="replace").translate(_PREVIEW_ESCAPES)
+
+
+def read_all(fd: int) -> bytes:
+    """Read fd to EOF in READ_BUF-sized requests (one syscall per 4 MiB instead of per 8 KiB)."""
+    chunks = []
+    while True:
+        chunk = os.read(fd, READ_BUF)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+@contextmanager
+def mapped(path: str) -> Iterator[bytes | mmap.mmap]:
+    """Map a file read-only for the duration of the block.
+    Empty files can't be mapped (b""); pipes, special files or filesystems that refuse mmap are read whole.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        st = os.fstat(fd)
+        if not stat.S_ISREG(st.st_mode):
+            yield read_all(fd)
+            return
+        if st.st_size == 0:
+            yield b""
+            return
+        # read once, front to back: widen readahead and start it now (best-effort)
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        try:
+            mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        except OSError:
+            yield read_all(fd)
+            return
+    finally:
+        os.close(fd)
+    # page faults on the map follow madvise, not the fd hint
+    if hasattr(mmap, "MADV_SEQUENTIAL"):
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+    try:
+        yield mm
+    finally:
+        mm.close()
+
+
+def line_reader(buf: bytes | mmap.mmap, start: int = 0) -> Callable[[], bytes]:
+    """readline() over buf from byte start: one line with its EOL per call, b"" at EOF (split in C)."""
+    if isinstance(buf, mmap.mmap):
+        buf.seek(start)
+        return buf.readline
+    reader = io.BytesIO(buf)
+    reader.seek(start)
+    return reader.readline
+
+
+def reverse_ascii_block(blk: bytes) -> bytes:
+    """reverse_line_bytes over every line of an ASCII block, in one split/join."""
+    parts = blk.split(b"\n")
+    last = parts.pop()  # after the final newline: b"" or an unterminated line, reversed whole
+    if b"\r" not in blk:
+        parts = list(map(_reverse_ascii, parts))
+    else:
+        parts = [p[-2::-1] + b"\r" if p[-1:] == b"\r" else p[::-1] for p in parts]
+    parts.append(_reverse_ascii(last))
+    return b"\n".join(parts)
+
+
+def ascii_block_run(in_buf: bytes | mmap.mmap, out_buf: bytes | mmap.mmap) -> tuple[int, int]:
+    """Bulk fast path: verify whole ASCII blocks with one C-level compare each.
+    A correct output has the same line spans as the input, so each block of whole input lines
+    is compared against the output bytes at the same offsets.
+    Returns (lines matched, bytes matched on each side); stops before the first non-ASCII or mismatching block.
+    """
+    size = len(in_buf)
+    pos = 0
+    lines = 0
+    while pos < size:
+        nl = in_buf.find(b"\n", min(pos + ASCII_BLOCK, size) - 1)
+        end = nl + 1 if nl != -1 else size
+        if nl == -1 and len(out_buf) != size:
+            break  # unterminated last line: the output's line must end at EOF too
+        blk = in_buf[pos:end]
+        out_blk = out_buf[pos:end]
+        if _native_verify_ascii is not None:
+            # the C kernel reads both blocks in full, so a short output block fails here first
+            if len(out_blk) != len(blk) or _native_verify_ascii(blk, out_blk, len(blk)) != len(blk):
+                break
+        elif not blk.isascii() or reverse_ascii_block(blk) != out_blk:
+            break
+        lines += blk.count(b"\n") + (nl == -1)
+        pos = end
+    return lines, pos
+
+
+def ascii_run(next_in: Callable[[], bytes], next_out: Callable[[], bytes]) -> tuple[int, int, bytes, bytes]:
+    """Fast path: consume line pairs while the input line is ASCII and the output line is its reverse.
+    Returns (lines matched, bytes consumed on each side, first unmatched in_line, its out_line);
+    in_line is b"" at input EOF, in which case no output line was consumed for it.
+    Matched lines have equal lengths on both sides, so one byte count covers both files.
+    """
+    matched = 0
+    consumed = 0
+    while True:
+        in_line = next_in()
+        if not in_line:
+            return matched, consumed, b"", b""
+        out_line = next_out()
+        if not in_line.isascii():
+            return matched, consumed, in_line, out_line
+        if in_line[-1] == 0x0A:  # in_line is non-empty here
+            if len(in_line) >= 2 and in_line[-2] == 0x0D:
+                exp = in_line[-3::-1] + b"\r\n"
+            else:
+                exp = in_line[-2::-1] + b"\n"
+        else:
+            exp = in_line[::-1]
+        if exp != out_line:
+            return matched, consumed, in_line, out_line
+        matched += 1
+        consumed += len(in_line)
+
+
+FileResult = tuple[int, int, int, int, int, int, list[str]]
+
+
+def verify_one(job: tuple[str, str, str, int, int]) -> FileResult:
+    """Verify one input/output pair.
+    Returns (files_tested, files_passed, files_skipped, lines_tested, lines_passed, extra_output_lines, log_lines);
+    log lines are buffered so the caller can print each file's report in input order.
+    Only the first max_fails FAIL reports are built (0 = all); later failures are still counted.
+    """
+    name, in_path, out_path, ctx, max_fails = job
+    log_lines: list[str] = []
+    log = log_lines.append
+
+    if not os.path.exists(out_path):
+        log(f"SKIP  {name} (no matching {out_path})")
+        return 0, 0, 1, 0, 0, 0, log_lines
+
+    file_ok = True
+
+    file_lines_tested = 0
+    file_lines_passed = 0
+    file_extra_output_lines = 0
+    file_fails = 0
+
+    with mapped(in_path) as in_buf, mapped(out_path) as out_buf:
+        # byte offsets are running sums of line lengths; lines are contiguous, so this is exact
+        line_no, in_pos = ascii_block_run(in_buf, out_buf)
+        out_pos = in_pos
+        file_lines_tested = file_lines_passed = line_no
+        # per-line checking resumes at the first block that wasn't verified in bulk
+        next_in = line_reader(in_buf, in_pos)
+        next_out = line_reader(out_buf, out_pos)
+
+        while True:
+            matched, consumed, in_line, out_line = ascii_run(next_in, next_out)
+            line_no += matched
+            file_lines_tested += matched
+            file_lines_passed += matched
+            in_pos += consumed
+            out_pos += consumed
+            if not in_line:
+                break
+
+            # slow path: non-ASCII input or a mismatch; checked and reported line by line
+            in_bytes_before_line = in_pos
+            in_pos += len(in_line)
+            in_bytes_to_line = in_pos
+
+            line_no += 1
+            file_lines_tested += 1
+
+            out_bytes_before_line = out_pos
+            out_pos += len(out_line)
+            out_bytes_to_line = out_pos
+
+            if not out_line:
+                file_ok = False
+                file_fails += 1
+                if max_fails and file_fails > max_fails:
+                    continue
+                exp = reverse_line_bytes(in_line)
+                log(
+                    f"FAIL  {name}: line {line_no}: output ended early "
+                    f"(in_bytes_before_line={in_bytes_before_line}, in_bytes_to_line={in_bytes_to_line}; "
+                    f"out_bytes_before_line={out_bytes_before_line}, out_bytes_to_line={out_bytes_to_line})"
+                )
+                show_i = min(len(exp), ctx)
+                log(f"  exp: ...{preview(exp, show_i, w=ctx)}...")
+                continue
+
+            exp = None
+            if len(out_line) == expected_len_fast(in_line):
+                exp = reverse_line_bytes(in_line)
+                if exp == out_line:
+                    file_lines_passed += 1
+                    continue
+
+            # mismatch
+            file_ok = False
+            file_fails += 1
+            if max_fails and file_fails > max_fails:
+                continue  # counted, not reported: skip building the report
+            if exp is None:
+                # length differs, so it can't match; exp is only needed for the report below
+                exp = reverse_line_bytes(in_line)
+            idx = first_mismatch(exp, out_line)
+            show_i = idx if idx >= 0 else 0
+
+            # absolute mismatch offsets (best-effort)
+            abs_in = (in_bytes_before_line + idx) if idx >= 0 else None
+            abs_out = (out_bytes_before_line + idx) if idx >= 0 else None
+
+            abs_in_s = str(abs_in) if abs_in is not None else "n/a"
+            abs_out_s = str(abs_out) if abs_out is not None else "n/a"
+
+            log(
+                f"FAIL  {name}: line {line_no}, byte {idx} "
+                f"(in_bytes_before_line={in_bytes_before_line}, in_bytes_to_line={in_bytes_to_line}, abs_in_byte={abs_in_s}; "
+                f"out_bytes_before_line={out_bytes_before_line}, out_bytes_to_line={out_bytes_to_line}, abs_out_byte={abs_out_s})"
+            )
+            log(f"  exp: ...{preview(exp, show_i, w=ctx)}...")
+            log(f"  out: ...{preview(out_line, show_i, w=ctx)}...")
+
+        # extra output lines after input EOF
+        extra_line_no = line_no + 1
+        in_eof = in_pos
+        for extra in iter(next_out, b""):
+            out_before = out_pos
+            out_pos += len(extra)
+            out_after = out_pos
+
+            file_ok = False
+            file_extra_output_lines += 1
+            file_fails += 1
+            if max_fails and file_fails > max_fails:
+                extra_line_no += 1
+                continue
+            log(
+                f"FAIL  {name}: extra output line {extra_line_no} "
+                f"(in_bytes_before_line={in_eof}, in_bytes_to_line={in_eof}; "
+                f"out_bytes_before_line={out_before}, out_bytes_to_line={out_after})"
+            )
+            extra_line_no += 1
+
+    if max_fails and file_fails > max_fails:
+        log(f"  ... {file_fails - max_fails} more FAIL reports for {name} not shown (--max-fails {max_fails})")
+    if file_ok:
+        log(f"FILE  PASS  {name}  (lines {file_lines_passed}/{file_lines_tested})")
+    else:
+        log(
+            f"FILE  FAIL  {name}  "
+            f"(lines {file_lines_passed}/{file_lines_tested}, extra_out_lines={file_extra_output_lines})"
+        )
+    return 1, int(file_ok), 0, file_lines_tested, file_lines_passed, file_extra_output_lines, log_lines
+
+
+def warm(job: tuple[str, str, str, int, int]) -> None:
+    """Read a job's regular files once to pull them into the page cache.
+    os.read releases the GIL, so this overlaps with verification running elsewhere.
+    """
+    for path in job[1:3]:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue  # missing output: verify_one reports the SKIP
+        try:
+            if stat.S_ISREG(os.fstat(fd).st_mode):  # never drain a pipe verify_one still has to read
+                while os.read(fd, READ_BUF):
+                    pass
+        finally:
+            os.close(fd)
+
+
+async def verify_all(
+    work: list[tuple[str, str, str, int, int]], pool: Executor, io_concurrency: int
+) -> list[tuple[int, int, int, int, int, int]]:
+    """Verify every job on pool with up to io_concurrency files in flight.
+    Each in-flight file is warmed on a thread while it waits for (and runs on) the pool, so reads of
+    queued files overlap with verification. Reports are printed in input order as soon as they're ready;
+    returns each file's counters.
+    """
+    loop = asyncio.get_running_loop()
+    sem = asyncio.Semaphore(io_concurrency)
+
+    async def one(job: tuple[str, str, str, int, int]) -> FileResult:
+        async with sem:
+            warming = asyncio.ensure_future(asyncio.to_thread(warm, job))
+            result = await loop.run_in_executor(pool, verify_one, job)
+            await warming
+            return result
+
+    tasks = [asyncio.ensure_future(one(job)) for job in work]
+    counts = []
+    for task in tasks:
+        *file_counts, log_lines = await task
+        print("\n".join(log_lines))
+        counts.append(tuple(file_counts))
+    return counts
 
 
 def main() -> int:
@@ -56,12 +447,27 @@ def main() -> int:
     ap.add_argument("output_dir", type=Path, help="Output folder (expects same filenames)")
     ap.add_argument("--pattern", default="*.txt", help="Glob for input files (default: *.txt)")
     ap.add_argument("--context", type=int, default=40, help="Preview width around mismatch (default: 40)")
+    ap.add_argument(
+        "--jobs", type=int, default=os.cpu_count() or 1,
+        help="Files verified in parallel worker processes; 1 runs in-process (default: CPU count)",
+    )
+    ap.add_argument(
+        "--io-concurrency", type=int, default=None,
+        help="Files read ahead and queued for verification at once (default: 2 x jobs)",
+    )
+    ap.add_argument(
+        "--max-fails", type=int, default=100,
+        help="FAIL reports printed per file; later failures are only counted, 0 shows all (default: 100)",
+    )
     args = ap.parse_args()
 
     in_dir: Path = args.input_dir
     out_dir: Path = args.output_dir
     pattern: str = args.pattern
     ctx: int = args.context
+    jobs: int = max(1, args.jobs)
+    max_fails: int = max(0, args.max_fails)
+    io_concurrency: int = max(1, args.io_concurrency or 2 * jobs)
 
     if not in_dir.is_dir():
         print(f"ERROR: input_dir is not a directory: {in_dir}")
@@ -70,7 +476,8 @@ def main() -> int:
         print(f"ERROR: output_dir is not a directory: {out_dir}")
         return 2
 
-    inputs = sorted(in_dir.glob(pattern))
+    # plain names and os.path strings: no Path object per file
+    inputs = sorted(e.name for e in os.scandir(in_dir) if fnmatch.fnmatchcase(e.name, pattern))
     if not inputs:
         print(f"No input files found in {in_dir} matching {pattern!r}")
         return 1
@@ -83,105 +490,19 @@ def main() -> int:
     total_lines_passed = 0
     total_extra_output_lines = 0
 
-    for in_path in inputs:
-        out_path = out_dir / in_path.name
-        if not out_path.exists():
-            files_skipped += 1
-            print(f"SKIP  {in_path.name} (no matching {out_path})")
-            continue
-
-        files_tested += 1
-        file_ok = True
-
-        file_lines_tested = 0
-        file_lines_passed = 0
-        file_extra_output_lines = 0
-
-        with in_path.open("rb") as fin, out_path.open("rb") as fout:
-            line_no = 0
-
-            while True:
-                in_bytes_before_line = fin.tell()
-                in_line = fin.readline()
-                if not in_line:
-                    break
-                in_bytes_to_line = fin.tell()
-
-                line_no += 1
-                file_lines_tested += 1
-
-                out_bytes_before_line = fout.tell()
-                out_line = fout.readline()
-                out_bytes_to_line = fout.tell()
-
-                exp = reverse_line_bytes(in_line)
-
-                if not out_line:
-                    file_ok = False
-                    print(
-                        f"FAIL  {in_path.name}: line {line_no}: output ended early "
-                        f"(in_bytes_before_line={in_bytes_before_line}, in_bytes_to_line={in_bytes_to_line}; "
-                        f"out_bytes_before_line={out_bytes_before_line}, out_bytes_to_line={out_bytes_to_line})"
-                    )
-                    show_i = min(len(exp), ctx)
-                    print(f"  exp: ...{preview(exp, show_i, w=ctx)}...")
-                    continue
-
-                if exp == out_line:
-                    file_lines_passed += 1
-                    continue
-
-                # mismatch
-                file_ok = False
-                idx = first_mismatch(exp, out_line)
-                show_i = idx if idx >= 0 else 0
-
-                # absolute mismatch offsets (best-effort)
-                abs_in = (in_bytes_before_line + idx) if idx >= 0 else None
-                abs_out = (out_bytes_before_line + idx) if idx >= 0 else None
-
-                abs_in_s = str(abs_in) if abs_in is not None else "n/a"
-                abs_out_s = str(abs_out) if abs_out is not None else "n/a"
-
-                print(
-                    f"FAIL  {in_path.name}: line {line_no}, byte {idx} "
-                    f"(in_bytes_before_line={in_bytes_before_line}, in_bytes_to_line={in_bytes_to_line}, abs_in_byte={abs_in_s}; "
-                    f"out_bytes_before_line={out_bytes_before_line}, out_bytes_to_line={out_bytes_to_line}, abs_out_byte={abs_out_s})"
-                )
-                print(f"  exp: ...{preview(exp, show_i, w=ctx)}...")
-                print(f"  out: ...{preview(out_line, show_i, w=ctx)}...")
-
-            # extra output lines after input EOF
-            extra_line_no = line_no + 1
-            in_eof = fin.tell()
-            while True:
-                out_before = fout.tell()
-                extra = fout.readline()
-                if not extra:
-                    break
-                out_after = fout.tell()
-
-                file_ok = False
-                file_extra_output_lines += 1
-                print(
-                    f"FAIL  {in_path.name}: extra output line {extra_line_no} "
-                    f"(in_bytes_before_line={in_eof}, in_bytes_to_line={in_eof}; "
-                    f"out_bytes_before_line={out_before}, out_bytes_to_line={out_after})"
-                )
-                extra_line_no += 1
-
-        total_lines_tested += file_lines_tested
-        total_lines_passed += file_lines_passed
-        total_extra_output_lines += file_extra_output_lines
-
-        if file_ok:
-            files_passed += 1
-            print(f"FILE  PASS  {in_path.name}  (lines {file_lines_passed}/{file_lines_tested})")
-        else:
-            print(
-                f"FILE  FAIL  {in_path.name}  "
-                f"(lines {file_lines_passed}/{file_lines_tested}, extra_out_lines={file_extra_output_lines})"
-            )
+    in_root = os.fspath(in_dir)
+    out_root = os.fspath(out_dir)
+    work = [(name, os.path.join(in_root, name), os.path.join(out_root, name), ctx, max_fails) for name in inputs]
+    # files are independent: worker processes verify them in parallel; jobs=1 uses one thread in-process
+    with ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else ThreadPoolExecutor(max_workers=1) as pool:
+        counts = asyncio.run(verify_all(work, pool, io_concurrency))
+    for tested, passed, skipped, lines_tested, lines_passed, extra_lines in counts:
+        files_tested += tested
+        files_passed += passed
+        files_skipped += skipped
+        total_lines_tested += lines_tested
+        total_lines_passed += lines_passed
+        total_extra_output_lines += extra_lines
 
     print("\n=== Summary ===")
     print(f"Files: {files_passed}/{files_tested} passed (skipped {files_skipped})")